@@ -1 +1,19 @@
 from .achaekek import *
+from .request_types import *
+
+
+def __getattr__(name: str):
+    # AsyncClient needs httpx, an optional dependency that is also slow to import, so
+    # it is only loaded when first used.
+    if name == "AsyncClient":
+        try:
+            from .async_client import AsyncClient
+        except ModuleNotFoundError as error:
+            if error.name != "httpx":
+                raise
+            raise ImportError(
+                "AsyncClient requires the httpx package, installed with "
+                "`achaekek[async]`."
+            ) from error
+        return AsyncClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,321 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Iterable
+import httpx
+import orjson
+
+from .achaekek import (
+    WireFormat,
+    _CBOR_HEADERS,
+    _JSON_HEADERS,
+    _cbor_body,
+    _check_wire_format,
+    _clean,
+    _json_body,
+)
+from .request_types import (
+    AwardBountyRequest,
+    CreateCommentRequest,
+    CreateMarketRequest,
+    GetBetsRequest,
+    GetCommentsRequest,
+    GetGroupsRequest,
+    GetLeaguesRequest,
+    GetManagramsRequest,
+    GetMarketsRequest,
+    GetPositionsRequest,
+    GetUsersRequest,
+    ModifyGroupRequest,
+    ResolveMarketRequest,
+    SearchRequest,
+    CreateBetRequest,
+    RequestModel,
+    SellSharesDPMRequest,
+    SellSharesRequest,
+    _dt_ms,
+)
+
+__all__ = ["AsyncClient"]
+
+
+class AsyncClient:
+    API_ROOT = "https://api.manifold.markets/v0"
+
+    def __init__(self, api_key: str, wire_format: WireFormat = "json"):
+        """
+        Creates a new asynchronous Manifold client with a given API key.
+
+        All requests share one HTTP/2 connection, which multiplexes concurrent calls as
+        separate streams, so even hundreds of requests awaited together use a single
+        socket. Close the client with `aclose`, or use it as an async context manager.
+
+        Parameters
+        ----------
+        api_key : str
+            Your Manifold API key, which can be found at https://manifold.markets/profile.
+        wire_format : Literal["json", "cbor"]
+            Optional. The encoding of request bodies, as for `Client`. Default is JSON.
+        """
+        _check_wire_format(wire_format)
+        self.api_key = api_key
+        self._wire_format = wire_format
+        self._client = httpx.AsyncClient(
+            http2=True,
+            base_url=self.API_ROOT,
+            headers={"Authorization": f"Key {api_key}"},
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _get(
+        self, endpoint: str, params: RequestModel | dict[str, Any] = RequestModel()
+    ) -> httpx.Response:
+        return await self._client.get(endpoint, params=_clean(params))
+
+    async def _get_json(
+        self, endpoint: str, params: RequestModel | dict[str, Any] = RequestModel()
+    ) -> Any:
+        response = await self._get(endpoint, params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _post(
+        self, endpoint: str, request: RequestModel | dict[str, Any] = RequestModel()
+    ) -> httpx.Response:
+        if self._wire_format == "cbor":
+            response = await self._client.post(
+                endpoint, content=_cbor_body(request), headers=_CBOR_HEADERS
+            )
+            if response.status_code != httpx.codes.UNSUPPORTED_MEDIA_TYPE:
+                return response
+            self._wire_format = "json"
+        return await self._client.post(
+            endpoint, content=_json_body(request), headers=_JSON_HEADERS
+        )
+
+    async def get_user(self, username: str) -> httpx.Response:
+        return await self._get(f"/user/{username}")
+
+    async def get_user_by_id(self, id: str) -> httpx.Response:
+        return await self._get(f"/user/by-id/{id}")
+
+    async def get_me(self) -> httpx.Response:
+        return await self._get("/me")
+
+    async def get_groups(
+        self, request: GetGroupsRequest = GetGroupsRequest()
+    ) -> httpx.Response:
+        return await self._get("/groups", params=request)
+
+    async def get_group(self, slug: str) -> httpx.Response:
+        return await self._get(f"/group/{slug}")
+
+    async def get_group_by_id(self, id: str) -> httpx.Response:
+        return await self._get(f"/group/by-id/{id}")
+
+    async def get_markets(
+        self, request: GetMarketsRequest = GetMarketsRequest()
+    ) -> httpx.Response:
+        return await self._get("/markets", params=request)
+
+    async def get_markets_json(
+        self, request: GetMarketsRequest = GetMarketsRequest()
+    ) -> list[dict[str, Any]]:
+        """
+        Lists markets like `get_markets`, but returns the response body as parsed by
+        orjson.
+
+        Parameters
+        ----------
+        request : GetMarketsRequest
+            The parameters of the listing.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            The markets returned by the Manifold API.
+
+        Raises
+        ------
+        httpx.HTTPStatusError
+            If the Manifold API returns an error status.
+        """
+        return await self._get_json("/markets", params=request)
+
+    async def get_market(self, market_id: str) -> httpx.Response:
+        return await self._get(f"/market/{market_id}")
+
+    async def get_markets_many(self, market_ids: Iterable[str]) -> list[httpx.Response]:
+        """
+        Fetches several markets by ID concurrently.
+
+        Parameters
+        ----------
+        market_ids : Iterable[str]
+            The IDs of the markets to fetch.
+
+        Returns
+        -------
+        list[httpx.Response]
+            The responses from the Manifold API, in the same order as the IDs.
+        """
+        return await asyncio.gather(*(self.get_market(id) for id in market_ids))
+
+    async def get_positions(
+        self, market_id: str, request: GetPositionsRequest
+    ) -> httpx.Response:
+        return await self._get(f"/market/{market_id}/positions", params=request)
+
+    async def get_market_by_slug(self, market_slug: str) -> httpx.Response:
+        return await self._get(f"/slug/{market_slug}")
+
+    async def search_markets(self, request: SearchRequest) -> httpx.Response:
+        return await self._get("/search-markets", params=request)
+
+    async def search_markets_json(self, request: SearchRequest) -> list[dict[str, Any]]:
+        return await self._get_json("/search-markets", params=request)
+
+    async def get_users(self, request: GetUsersRequest) -> httpx.Response:
+        return await self._get("/users", params=request)
+
+    async def create_bet(self, request: CreateBetRequest) -> httpx.Response:
+        return await self._post("/bet", request)
+
+    async def cancel_bet(self, id: str) -> httpx.Response:
+        return await self._post(f"/bet/cancel/{id}")
+
+    async def create_market(self, market: CreateMarketRequest) -> httpx.Response:
+        """
+        Posts a request to create a market on Manifold.
+
+        Parameters
+        ----------
+        market : CreateMarketRequest
+            The market to create. Can be of any of the types supported by Manifold: binary (0% - 100%), pseudo-numeric (minimum to maximum), multiple choice, bountied question, or a poll question.
+
+        Returns
+        -------
+        httpx.Response
+            The response from the Manifold API.
+        """
+        return await self._post("/market", market)
+
+    async def create_markets(
+        self, markets: Iterable[CreateMarketRequest], concurrency: int = 16
+    ) -> list[httpx.Response]:
+        """
+        Posts requests to create several markets on Manifold concurrently.
+
+        Parameters
+        ----------
+        markets : Iterable[CreateMarketRequest]
+            The markets to create.
+        concurrency : int
+            Optional. The maximum number of requests in flight at once. Default is 16.
+            This is the only limit applied: the client's connection pool is shared with
+            every other call, so it is not resized here. Over HTTP/2 the requests are
+            multiplexed on a single connection in any case.
+
+        Returns
+        -------
+        list[httpx.Response]
+            The responses from the Manifold API, in the same order as the markets.
+
+        Raises
+        ------
+        ValueError
+            If `concurrency` is less than 1.
+        """
+        if concurrency < 1:
+            raise ValueError(f"Concurrency must be at least 1, not {concurrency}.")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def create(market: CreateMarketRequest) -> httpx.Response:
+            async with semaphore:
+                return await self._post("/market", market)
+
+        return await asyncio.gather(*(create(m) for m in markets))
+
+    async def create_market_answer(self, market_id: str, text: str) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/answer", {"text": text})
+
+    async def add_liquidity(self, market_id: str, amount: int) -> httpx.Response:
+        return await self._post(
+            f"/market/{market_id}/add-liquidity", {"amount": amount}
+        )
+
+    async def add_bounty(self, market_id: str, amount: int) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/add-bounty", {"amount": amount})
+
+    async def award_bounty(
+        self, market_id: str, award: AwardBountyRequest
+    ) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/award-bounty", award)
+
+    async def set_close_time(
+        self, market_id: str, close_time: datetime = None
+    ) -> httpx.Response:
+        close_time_millis = _dt_ms(close_time) if close_time else None
+        return await self._post(
+            f"/market/{market_id}/close", {"closeTime": close_time_millis}
+        )
+
+    async def modify_group(
+        self, market_id: str, request: ModifyGroupRequest
+    ) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/group", request)
+
+    async def resolve_market(
+        self, market_id: str, resolution: ResolveMarketRequest
+    ) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/resolve", resolution)
+
+    async def sell_shares(
+        self, market_id: str, request: SellSharesRequest
+    ) -> httpx.Response:
+        return await self._post(f"/market/{market_id}/sell", request)
+
+    async def sell_shares_dpm(
+        self, market_id: str, request: SellSharesDPMRequest
+    ) -> httpx.Response:
+        return await self._post(f"/sell-shares-dpm", request)
+
+    async def create_comment(self, comment: CreateCommentRequest) -> httpx.Response:
+        return await self._post("/comment", comment)
+
+    async def get_comments(
+        self, request: GetCommentsRequest = GetCommentsRequest()
+    ) -> httpx.Response:
+        return await self._get("/comments", params=request)
+
+    async def get_comments_json(
+        self, request: GetCommentsRequest = GetCommentsRequest()
+    ) -> list[dict[str, Any]]:
+        return await self._get_json("/comments", params=request)
+
+    async def get_bets(
+        self, request: GetBetsRequest = GetBetsRequest()
+    ) -> httpx.Response:
+        return await self._get("/bets", params=request)
+
+    async def get_bets_json(
+        self, request: GetBetsRequest = GetBetsRequest()
+    ) -> list[dict[str, Any]]:
+        return await self._get_json("/bets", params=request)
+
+    async def get_managrams(
+        self, request: GetManagramsRequest = GetManagramsRequest()
+    ) -> httpx.Response:
+        return await self._get("/managrams", params=request)
+
+    async def get_leagues(
+        self, request: GetLeaguesRequest = GetLeaguesRequest()
+    ) -> httpx.Response:
+        return await self._get("/leagues", params=request)
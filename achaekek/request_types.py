@@ -1,8 +1,55 @@
-from typing import Literal
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Final,
+    Literal,
+    Union,
+    get_args,
+    get_origin,
+)
 from enum import Enum
 from datetime import datetime
-import time
-from dataclasses import dataclass, field
+from dataclasses import Field, dataclass, field, fields, is_dataclass
+
+__all__ = [
+    "OutcomeType",
+    "DescriptionFormat",
+    "AddAnswersMode",
+    "MarketSort",
+    "SortOrder",
+    "SearchSort",
+    "SearchFilter",
+    "SearchContractType",
+    "RequestModel",
+    "CreateBinaryMarket",
+    "CreatePseudoNumericMarket",
+    "CreateMultipleChoiceMarket",
+    "CreatePollMarket",
+    "CreateBountiedQuestionMarket",
+    "CreateBetRequest",
+    "GetMarketsRequest",
+    "GetBetsRequest",
+    "GetCommentsRequest",
+    "SearchRequest",
+    "GetGroupsRequest",
+    "GetPositionsRequest",
+    "GetUsersRequest",
+    "AwardBountyRequest",
+    "ModifyGroupRequest",
+    "ResolveBinaryMarket",
+    "MultipleChoiceResolution",
+    "ResolveMultipleChoiceMarket",
+    "ResolveNumericMarket",
+    "SellSharesRequest",
+    "SellSharesDPMRequest",
+    "CreateCommentRequest",
+    "GetManagramsRequest",
+    "GetLeaguesRequest",
+    "CreateMarketRequest",
+    "ResolveMarketRequest",
+]
 
 
 class OutcomeType(Enum):
@@ -19,80 +66,297 @@ class DescriptionFormat(Enum):
     JSON = "descriptionJSON"
 
 
-@dataclass(kw_only=True)
-class _CreateMarket:
-    question: str
-    closeTime: datetime = None
-    description: str | tuple[str, DescriptionFormat] = None
-    visibility: Literal["public", "unlisted"] = None
-    groupIds: list[str] = None
-    extraLiquidity: int = None
+class AddAnswersMode(Enum):
+    DISABLED = "DISABLED"
+    ONLY_CREATORS = "ONLY_CREATORS"
+    ANYONE = "ANYONE"
+
+
+class MarketSort:
+    """
+    The values accepted by `GetMarketsRequest.sort`, as constants that can be passed
+    in place of the string literals.
+    """
+
+    CREATED_TIME: Final = "created-time"
+    UPDATED_TIME: Final = "updated-time"
+    LAST_BET_TIME: Final = "last-bet-time"
+    LAST_COMMENT_TIME: Final = "last-comment-time"
+
+
+class SortOrder:
+    """The values accepted by the `order` of `GetMarketsRequest` and `GetBetsRequest`."""
+
+    ASC: Final = "asc"
+    DESC: Final = "desc"
+
+
+class SearchSort:
+    """The values accepted by `SearchRequest.sort`."""
+
+    SCORE: Final = "score"
+    NEWEST: Final = "newest"
+    LIQUIDITY: Final = "liquidity"
+
+
+class SearchFilter:
+    """The values accepted by `SearchRequest.filter`."""
 
-    def to_json(self):
+    ALL: Final = "all"
+    OPEN: Final = "open"
+    CLOSED: Final = "closed"
+    RESOLVED: Final = "resolved"
+    CLOSING_THIS_MONTH: Final = "closing-this-month"
+    CLOSING_NEXT_MONTH: Final = "closing-next-month"
+
+
+class SearchContractType:
+    """The values accepted by `SearchRequest.contractType`."""
+
+    ALL: Final = "ALL"
+    BINARY: Final = "BINARY"
+    MULTIPLE_CHOICE: Final = "MULTIPLE_CHOICE"
+    BOUNTY: Final = "BOUNTY"
+    POLL: Final = "POLL"
+
+
+def _dt_ms(dt: datetime) -> int:
+    """
+    Converts a datetime to milliseconds since the Unix epoch, as used for timestamps
+    by the Manifold API. Naive datetimes are taken to be in local time.
+    """
+    return int(dt.timestamp() * 1000)
+
+
+def _conversion(annotation: Any, source: str) -> str:
+    """
+    Generates an expression converting the value of the Python expression `source`,
+    annotated as `annotation`, into its JSON representation.
+    """
+    if get_origin(annotation) in (Union, UnionType):
+        # Fields are skipped when None, so convert them as their non-None type.
+        annotation = Union[tuple(a for a in get_args(annotation) if a is not NoneType)]
+
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        # `.value` is a Python-level property on every member, whereas `_value_` is the
+        # plain instance attribute that it reads.
+        return f"{source}._value_"
+    elif annotation is datetime:
+        return f"_dt_ms({source})"
+    else:
+        return source
+
+
+def _field_source(f: Field, key_field: Field | None = None) -> list[str]:
+    """
+    Generates the lines of a compiled `to_json` that copy a single dataclass field into
+    the JSON dictionary, converting its value according to the field's annotation.
+    """
+    if "encoder" in f.metadata:
+        expression = f"_encoders[{f.name!r}](value)"
+    else:
+        expression = _conversion(f.type, "value")
+
+    condition = "value is not None"
+    if f.metadata.get("omit_default"):
+        # Left out of the JSON while the field still has its default value.
+        condition += f" and value != {f.default!r}"
+
+    if key_field is not None:
+        # The JSON key is the value of another field, e.g. a description format.
+        key = _conversion(key_field.type, f"self.{key_field.name}")
+        return [
+            f"    value = self.{f.name}",
+            f"    if {condition}:",
+            f"        if self.{key_field.name} is None:",
+            f"            json[{f.name!r}] = {expression}",
+            "        else:",
+            f"            json[{key}] = {expression}",
+        ]
+
+    return [
+        f"    value = self.{f.name}",
+        f"    if {condition}:",
+        f"        json[{f.name!r}] = {expression}",
+    ]
+
+
+def _json_encoder(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """
+    Compiles a `to_json` function specialised to the fields of a request dataclass.
+
+    The generated function reads each field directly by name and applies its
+    conversion inline, instead of filtering the instance dictionary and then patching
+    up special keys on every call. It is compiled once per class, on first use, and
+    then installed as the class's `_encode` method.
+    """
+    # The bare RequestModel is not a dataclass, and has no fields.
+    cls_fields = fields(cls) if is_dataclass(cls) else ()
+    fields_by_name = {f.name: f for f in cls_fields}
+    key_fields = {
+        f.metadata["key_field"] for f in cls_fields if "key_field" in f.metadata
+    }
+    source = ["def to_json(self):", "    json = {}"]
+    for f in cls_fields:
+        if f.name not in key_fields:
+            key_field = fields_by_name.get(f.metadata.get("key_field"))
+            source += _field_source(f, key_field)
+    for name in cls._WIRE_CONSTANTS:
+        # Constant for every instance of the class, so written as a literal.
+        source.append(f"    json[{name!r}] = {getattr(cls, name)!r}")
+    source.append("    return json")
+
+    encoders = {
+        f.name: f.metadata["encoder"] for f in cls_fields if "encoder" in f.metadata
+    }
+    namespace = {}
+    scope = {"_dt_ms": _dt_ms, "_encoders": encoders}
+    exec("\n".join(source), scope, namespace)
+    return namespace["to_json"]
+
+
+def _encode_on_first_use(self) -> dict[str, Any]:
+    """
+    Stands in for the `_encode` method of a request class until it is first called,
+    when it compiles the class's encoder and installs it on the class in its place.
+    """
+    cls = type(self)
+    cls._encode = _json_encoder(cls)
+    return cls._encode(self)
+
+
+class RequestModel:
+    __slots__ = ("_json",)
+
+    # Class variables sent with every request of the class, such as a market's
+    # `outcomeType`. Only those named here are sent.
+    _WIRE_CONSTANTS: tuple[str, ...] = ()
+
+    _encode = _encode_on_first_use
+
+    def __init_subclass__(cls, **kwargs):
+        # Each class gets its own stand-in, so that it is replaced by an encoder for that
+        # class, not one for a parent. Classes that define their own `_encode` keep it.
+        # The encoder is compiled lazily, as the dataclass fields do not exist yet.
+        super().__init_subclass__(**kwargs)
+        if "_encode" not in cls.__dict__:
+            cls._encode = _encode_on_first_use
+
+    def to_json(self) -> dict[str, Any]:
         """
-        Converts the create market request dataclass to a JSON dictionary suitable for sending as a request to the
-        Manifold API, reformatting the close time and description as needed.
+        Converts the request to a JSON dictionary suitable for sending as a request to the
+        Manifold API.
+
+        Each call returns a new dictionary, which can be modified without affecting the
+        request. To send a request with different fields, for example the next page of a
+        paginated listing, create a new request with `dataclasses.replace`.
 
         Returns
         -------
         json: dict[str, Any]
             The JSON dictionary to be sent as a request.
         """
-        json = {k: v for k, v in self.__dict__.items() if v is not None}
-        if "outcomeType" in json:
-            json["outcomeType"] = self.outcomeType.value
-        if "closeTime" in json:
-            json["closeTime"] = int(time.mktime(self.closeTime.timetuple()) * 1000)
-        if "description" in json and isinstance(self.description, tuple):
-            json[self.description[1].value] = self.description[0]
-            del json["description"]
+        return dict(self._cached_json())
 
-        return json
+    def _cached_json(self) -> dict[str, Any]:
+        # Requests are frozen, so the clients encode each one once and reuse the result.
+        # The dictionary is shared between sends and must not be modified.
+        try:
+            return self._json
+        except AttributeError:
+            json = self._encode()
+            object.__setattr__(self, "_json", json)
+            return json
 
 
-@dataclass
+def _split_description(request: RequestModel) -> None:
+    """
+    Splits a description given as a `(text, format)` tuple into the request's
+    `description` and `descriptionFormat` fields, once at construction, so that
+    serialization only ever sees plain text.
+
+    Raises
+    ------
+    TypeError
+        If the tuple is not a `(text, format)` pair, or a format is also given in
+        `descriptionFormat`.
+    """
+    if isinstance(request.description, tuple):
+        if len(request.description) != 2:
+            raise TypeError(
+                "A description tuple must be a (text, format) pair, not "
+                f"{request.description!r}."
+            )
+        if request.descriptionFormat is not None:
+            raise TypeError(
+                "A description format was given both in the description tuple and as "
+                "descriptionFormat."
+            )
+        description, description_format = request.description
+        # Requests are frozen, so their fields can only be set through object.
+        object.__setattr__(request, "description", description)
+        object.__setattr__(request, "descriptionFormat", description_format)
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class _CreateMarket(RequestModel):
+    _WIRE_CONSTANTS: ClassVar[tuple[str, ...]] = ("outcomeType",)
+
+    question: str
+    closeTime: datetime | None = None
+    description: str | tuple[str, DescriptionFormat] | None = field(
+        default=None, metadata={"key_field": "descriptionFormat"}
+    )
+    descriptionFormat: DescriptionFormat | None = None
+    visibility: Literal["public", "unlisted"] | None = None
+    groupIds: list[str] | None = None
+    extraLiquidity: int | None = None
+
+    def __post_init__(self):
+        _split_description(self)
+
+
+@dataclass(slots=True, frozen=True)
 class CreateBinaryMarket(_CreateMarket):
     initialProb: int
-    outcomeType: OutcomeType = field(default=OutcomeType.BINARY)
+    outcomeType: ClassVar[str] = OutcomeType.BINARY.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreatePseudoNumericMarket(_CreateMarket):
     question: str
     min: float
     max: float
     isLogScale: bool
     initialValue: float
-    outcomeType: OutcomeType = field(default=OutcomeType.PSEUDO_NUMERIC)
+    outcomeType: ClassVar[str] = OutcomeType.PSEUDO_NUMERIC.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateMultipleChoiceMarket(_CreateMarket):
     question: str
     answers: list[str]
-    addAnswersMode: Literal["DISABLED", "ONLY_CREATORS", "ANYONE"]
-    outcomeType: OutcomeType = field(default=OutcomeType.MULTIPLE_CHOICE)
-    shouldAnswersSumToOne: bool = True
+    addAnswersMode: AddAnswersMode
+    outcomeType: ClassVar[str] = OutcomeType.MULTIPLE_CHOICE.value
+    shouldAnswersSumToOne: bool = field(default=True, metadata={"omit_default": True})
 
-    def to_json(self):
-        dictionary = super().to_json()
-        if "addAnswersMode" in dictionary:
-            dictionary["addAnswersMode"] = dictionary["addAnswersMode"].value
-        if "shouldAnswersSumToOne" in dictionary and dictionary["shouldAnswersSumToOne"]:
-            del dictionary["shouldAnswersSumToOne"]
-        return dictionary
+    def __post_init__(self):
+        # Zero-argument super() does not work in methods of slotted dataclasses.
+        _CreateMarket.__post_init__(self)
+        # Also accept the mode's string value, e.g. "ANYONE", as before it was an enum.
+        object.__setattr__(self, "addAnswersMode", AddAnswersMode(self.addAnswersMode))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreatePollMarket(_CreateMarket):
     answers: list[str]
-    outcomeType: OutcomeType = field(default=OutcomeType.POLL)
+    outcomeType: ClassVar[str] = OutcomeType.POLL.value
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateBountiedQuestionMarket(_CreateMarket):
     totalBounty: int
-    outcomeType: OutcomeType = field(default=OutcomeType.BOUNTIED_QUESTION)
+    outcomeType: ClassVar[str] = OutcomeType.BOUNTIED_QUESTION.value
 
 
 CreateMarketRequest = (
@@ -104,30 +368,18 @@ CreateMarketRequest = (
 )
 
 
-class RequestModel:
-    def to_json(self):
-        return {k: v for k, v in self.__dict__.items() if v is not None}
-
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateBetRequest(RequestModel):
     amount: int
     contractId: str
     outcome: Literal["YES", "NO"] = field(default="YES")
-    limitprob: float = None
-    expiresAt: datetime = None
+    limitprob: float | None = field(
+        default=None, metadata={"encoder": lambda limitprob: round(limitprob, 2)}
+    )
+    expiresAt: datetime | None = None
 
-    def to_json(self):
-        json = super.to_json()
-        json["outcome"] = json["outcome"].value
-        if "limitprob" in json:
-            json["limitprob"] = round(json["limitprob"], 2)
-        if "expiresAt" in json:
-            json["expiresAt"] = int(time.mktime(self.expiresAt.timetuple()) * 1000)
-        return json
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetMarketsRequest(RequestModel):
     """
     Request parameters for the get_markets method, to list all markets, defaulting to creation date descending.
@@ -158,7 +410,7 @@ class GetMarketsRequest(RequestModel):
     groupId: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetBetsRequest(RequestModel):
     userId: str = None
     username: str = None
@@ -171,7 +423,7 @@ class GetBetsRequest(RequestModel):
     order: Literal["asc", "desc"] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetCommentsRequest(RequestModel):
     contractId: str = None
     contractSlug: str = None
@@ -180,7 +432,7 @@ class GetCommentsRequest(RequestModel):
     userId: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SearchRequest(RequestModel):
     term: str
     sort: Literal["score", "newest", "liquidity"] = None
@@ -194,19 +446,13 @@ class SearchRequest(RequestModel):
     offset: int = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetGroupsRequest(RequestModel):
     beforeTime: datetime = None
     availableToUserId: str = None
 
-    def to_json(self):
-        json = super.to_json()
-        if "beforeTime" in json:
-            json["beforeTime"] = int(time.mktime(self.beforeTime.timetuple()) * 1000)
-        return json
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetPositionsRequest(RequestModel):
     order: Literal["shares", "profit"] = None
     top: int = None
@@ -214,49 +460,50 @@ class GetPositionsRequest(RequestModel):
     userId: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetUsersRequest(RequestModel):
     limit: int = None
     before: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AwardBountyRequest(RequestModel):
     amount: int
     commentId: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModifyGroupRequest(RequestModel):
     groupId: str
     remove: bool = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolveBinaryMarket(RequestModel):
     outcome: Literal["YES", "NO", "MKT", "CANCEL"]
     probabilityInt: int = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MultipleChoiceResolution:
     answer: str
     pct: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolveMultipleChoiceMarket(RequestModel):
     outcome: Literal["MKT", "CANCEL"] | int
-    resolutions: list[MultipleChoiceResolution] = None
+    resolutions: list[MultipleChoiceResolution] = field(
+        default=None,
+        metadata={
+            "encoder": lambda resolutions: [
+                {"answer": r.answer, "pct": r.pct} for r in resolutions
+            ]
+        },
+    )
 
-    def to_json(self):
-        json = super.to_json()
-        if "resolutions" in json:
-            json["resolutions"] = [r.__dict__ for r in self.resolutions]
-        return json
 
-
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResolveNumericMarket(RequestModel):
     """
     Parameters
@@ -283,34 +530,32 @@ ResolveMarketRequest = (
 )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SellSharesRequest(RequestModel):
     outcome: Literal["YES", "NO"] = None
     shares: int = None
     answerId: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SellSharesDPMRequest(RequestModel):
     contractId: str = None
     betId: str = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateCommentRequest(RequestModel):
     contractId: str
-    description: str | tuple[str, Literal["content", "html", "markdown"]] = None
-
-    def to_json(self):
-        json = super().to_json()
-        if "description" in json and isinstance(self.description, tuple):
-            json[self.description[1]] = self.description[0]
-            del json["description"]
+    description: str | tuple[str, Literal["content", "html", "markdown"]] = field(
+        default=None, metadata={"key_field": "descriptionFormat"}
+    )
+    descriptionFormat: Literal["content", "html", "markdown"] | None = None
 
-        return json
+    def __post_init__(self):
+        _split_description(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetManagramsRequest(RequestModel):
     toId: str = None
     fromId: str = None
@@ -318,16 +563,8 @@ class GetManagramsRequest(RequestModel):
     before: datetime = None
     after: datetime = None
 
-    def to_json(self):
-        json = super().to_json()
-        if "before" in json:
-            json["before"] = int(time.mktime(self.before.timetuple()) * 1000)
-        if "after" in json:
-            json["after"] = int(time.mktime(self.after.timetuple()) * 1000)
-        return json
-
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GetLeaguesRequest(RequestModel):
     userId: str = None
     season: int = None